@@ -1,5 +1,6 @@
 import os
 from platform import system
+from typing import Dict
 
 if system() == "Windows":
 
@@ -28,21 +29,43 @@ if system() == "Windows":
 else:
     import fcntl  # type: ignore
 
+# Opting out of file locking (PRIOR_NO_LOCK=1) skips the lock-file open and
+# the lockf syscalls entirely, for single-process notebook/CI use where
+# cross-process coordination is gratuitous.
+_NO_LOCK = os.environ.get("PRIOR_NO_LOCK") == "1"
+
+_fd_cache: Dict[str, int] = {}
+"""Open lock-file descriptors by path, so repeated locks on the same file
+don't pay an os.open/os.close pair each time. POSIX record locks are held
+per process, so keeping the fd open does not change locking semantics."""
+
+
+def _get_lock_fd(path: str) -> int:
+    fd = _fd_cache.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT)
+        _fd_cache[path] = fd
+    return fd
+
 
 class Lock:
     def __init__(self, target, mode):
         self._lock_file_path = target + ".lock"
-        self._lock_file = os.open(self._lock_file_path, os.O_RDWR | os.O_CREAT)
         self.mode = mode
+        self._lock_file = None if _NO_LOCK else _get_lock_fd(self._lock_file_path)
 
     def lock(self):
-        fcntl.lockf(self._lock_file, self.mode)
+        if self._lock_file is not None:
+            fcntl.lockf(self._lock_file, self.mode)
 
     def unlock(self):
-        fcntl.lockf(self._lock_file, fcntl.LOCK_UN)
-        os.close(self._lock_file)
+        if self._lock_file is not None:
+            fcntl.lockf(self._lock_file, fcntl.LOCK_UN)
 
     def unlink(self):
+        fd = _fd_cache.pop(self._lock_file_path, None)
+        if fd is not None:
+            os.close(fd)
         os.unlink(self._lock_file_path)
 
     def __enter__(self):
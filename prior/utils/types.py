@@ -1,5 +1,15 @@
+import gzip
+import io
 import json
-from typing import Any, Dict, List, Optional, Sequence, Union
+import mmap
+import os
+import queue
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
 # Literal was introduced in Python 3.8
 try:
@@ -7,30 +17,158 @@ try:
 except ImportError:
     from typing_extensions import Literal  # type: ignore
 
+# orjson parses JSON several times faster than the stdlib and accepts bytes
+# directly. It's optional, so fall back to stdlib json when not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+
+    def _intern_keys(pairs: List[Any]) -> Dict[str, Any]:
+        # The same few dozen keys repeat across every record; interning
+        # shares one str object per key instead of allocating one per
+        # occurrence. orjson caches short keys natively, so this only
+        # matters on the stdlib fallback.
+        return {sys.intern(k): v for k, v in pairs}
+
+    def _json_loads(buf: Union[bytes, str]) -> Any:
+        return json.loads(buf, object_pairs_hook=_intern_keys)
+
+
+# pysimdjson is faster still on large records (SIMD-accelerated structural
+# indexing); prefer it when installed. The parser is reused across calls —
+# per-call parser construction is where most of its overhead lives.
+try:
+    import simdjson as _simdjson
+
+    _simdjson_parser = _simdjson.Parser()
+    # The shared parser is not thread-safe, and the next parse() invalidates
+    # the previous result's proxies — parse and materialize must be one
+    # atomic step under a module-level lock.
+    _simdjson_lock = threading.Lock()
+
+    def _materialize(doc: Any) -> Any:
+        # The proxies returned by the parser alias its reused buffer, so
+        # materialize before the next parse call invalidates them.
+        if isinstance(doc, _simdjson.Object):
+            return doc.as_dict()
+        if isinstance(doc, _simdjson.Array):
+            return doc.as_list()
+        return doc
+
+    def _parse_record(buf: Union[bytes, str]) -> Any:
+        with _simdjson_lock:
+            return _materialize(_simdjson_parser.parse(buf))
+
+except ImportError:
+    _simdjson = None  # type: ignore
+    _parse_record = _json_loads
+
+_MISSING = object()
+"""Sentinel distinguishing a cache miss from a cached JSON null."""
+
+# zstd decompresses several times faster than zlib; support .zst datasets
+# when the optional zstandard package is installed.
+try:
+    import zstandard as _zstandard
+except ImportError:
+    _zstandard = None  # type: ignore
+
+
+class _MmapJsonLines:
+    """A read-only sequence of raw JSON lines backed by a memory-mapped file.
+
+    Only the line-offset index is held in memory; the bytes of each record
+    are sliced out of the mapping on demand, so the OS page cache decides
+    what stays resident instead of a Python list of strings.
+    """
+
+    __slots__ = ("_mmap", "_offsets", "_path")
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._map()
+        size = len(self._mmap)
+        offsets = [0]
+        pos = self._mmap.find(b"\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = self._mmap.find(b"\n", pos + 1)
+        if offsets[-1] < size:
+            # The final line has no trailing newline.
+            offsets.append(size)
+        self._offsets = offsets
+
+    def _map(self) -> None:
+        with open(self._path, "rb") as f:
+            # mmap refuses zero-length files; an empty split is valid, so
+            # stand in an empty bytes object (find/len/slicing all match).
+            if os.fstat(f.fileno()).st_size == 0:
+                self._mmap = b""  # type: ignore
+            else:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __getstate__(self):
+        # The mapping itself can't be pickled; carry the path plus the
+        # offset index and re-map on restore (e.g. in DataLoader workers).
+        return (self._path, self._offsets)
+
+    def __setstate__(self, state):
+        self._path, self._offsets = state
+        self._map()
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._mmap[self._offsets[index] : self._offsets[index + 1]].rstrip(b"\r\n")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
 
 class Dataset:
+    # Slots drop the per-instance __dict__ and speed up attribute access.
+    __slots__ = ("data", "dataset", "split", "_length")
+
     def __init__(
-        self, data: List[Any], dataset: str, split: Literal["train", "val", "test"]
+        self,
+        data: Union[Sequence[Any], Iterable[Any]],
+        dataset: str,
+        split: Literal["train", "val", "test"],
+        length: Optional[int] = None,
     ) -> None:
         """Initialize a dataset split.
 
         Args:
-            data: The data of the dataset split.
+            data: The data of the dataset split. A streaming (one-shot)
+                iterable is accepted for consumers that only iterate; such a
+                dataset cannot be indexed or re-iterated.
             dataset: The name of the dataset.
             split: The name of the dataset split.
+            length: The number of items, when known. Only needed when data
+                is an iterable without a len().
         """
         self.data = data
         self.dataset = dataset
         self.split = split
+        self._length = length
 
     def __iter__(self):
         """Return an iterator over the dataset."""
-        for item in self.data:
-            yield item
+        # Delegating to the underlying container's C-level iterator avoids a
+        # Python generator frame per item.
+        return iter(self.data)
 
     def __len__(self) -> int:
         """Return the number of items in the dataset."""
-        return len(self.data)
+        if self._length is None:
+            self._length = len(self.data)  # type: ignore
+        return self._length
 
     def __getitem__(self, index: int) -> Any:
         """Return the item at the given index."""
@@ -38,10 +176,19 @@ class Dataset:
 
     def __repr__(self):
         """Return a string representation of the dataset."""
+        # Never force a streaming iterable to materialize just to print its
+        # size; a repr should be O(1).
+        if self._length is not None:
+            size: Any = self._length
+        else:
+            try:
+                size = len(self.data)  # type: ignore
+            except TypeError:
+                size = "unknown"
         return (
             "Dataset(\n"
             f"    dataset={self.dataset},\n"
-            f"    size={len(self.data)},\n"
+            f"    size={size},\n"
             f"    split={self.split}\n"
             ")"
         )
@@ -63,36 +210,209 @@ class Dataset:
 class LazyJsonDataset(Dataset):
     """Lazily load the json house data."""
 
+    __slots__ = ("cached_data", "_cache_max", "_cache_lock")
+
     def __init__(
-        self, data: List[Any], dataset: str, split: Literal["train", "val", "test"]
+        self,
+        data: Sequence[Any],
+        dataset: str,
+        split: Literal["train", "val", "test"],
+        cache_size: int = 1024,
     ) -> None:
+        """Initialize a lazily parsed dataset split.
+
+        Args:
+            data: The raw JSON records of the split.
+            dataset: The name of the dataset.
+            split: The name of the dataset split.
+            cache_size: Maximum number of parsed records kept resident; the
+                least recently used entry is evicted beyond that, bounding
+                memory to O(cache_size) instead of O(len(data)).
+        """
+        if isinstance(data, list) and any(isinstance(x, str) for x in data):
+            # Parsers consume UTF-8 bytes; encoding once here avoids a hidden
+            # per-access encode (and orjson/simdjson take bytes natively).
+            data = [x.encode("utf-8") if isinstance(x, str) else x for x in data]
         super().__init__(data, dataset, split)
-        self.cached_data: Dict[int, Union[list, dict]] = {}
+        self.cached_data: "OrderedDict[int, Any]" = OrderedDict()
+        self._cache_max = cache_size
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def from_jsonl(
+        cls, path: str, dataset: str, split: Literal["train", "val", "test"]
+    ) -> "LazyJsonDataset":
+        """Create a dataset backed by a memory-mapped JSON-lines file.
+
+        Args:
+            path: Path to a file with one JSON record per line. A ".gz" or
+                ".zst" file is decompressed as a stream, one line at a time,
+                so the full decompressed buffer is never held alongside the
+                line list. Reading ".zst" requires the optional zstandard
+                package.
+            dataset: The name of the dataset.
+            split: The name of the dataset split.
+        """
+        if path.endswith(".zst"):
+            if _zstandard is None:
+                raise ImportError(
+                    "Reading .zst datasets requires the zstandard package:" " pip install zstandard"
+                )
+            with open(path, "rb") as f:
+                with _zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                    lines = [line.rstrip(b"\r\n") for line in io.BufferedReader(reader)]
+            return cls(data=lines, dataset=dataset, split=split)
+        if path.endswith(".gz"):
+            with gzip.open(path, "rb") as f:
+                return cls(data=[line.rstrip(b"\r\n") for line in f], dataset=dataset, split=split)
+        return cls(data=_MmapJsonLines(path), dataset=dataset, split=split)
 
     def __getitem__(self, index: int) -> Any:
         """Return the item at the given index."""
-        if index not in self.cached_data:
-            self.cached_data[index] = json.loads(self.data[index])
-        return self.cached_data[index]
+        # The hit path takes no lock: a single dict.get (individual dict ops
+        # are atomic under the GIL) and an LRU promotion that tolerates a
+        # concurrent eviction.
+        cache = self.cached_data
+        value = cache.get(index, _MISSING)
+        if value is not _MISSING:
+            try:
+                cache.move_to_end(index)
+            except KeyError:
+                pass
+            return value
+        # Serialize only the parse, double-checking under the lock so
+        # concurrent misses on the same index don't both pay for it.
+        with self._cache_lock:
+            value = cache.get(index, _MISSING)
+            if value is not _MISSING:
+                return value
+            value = _parse_record(self.data[index])
+            cache[index] = value
+            if len(cache) > self._cache_max:
+                cache.popitem(last=False)
+        return value
 
-    def __len__(self) -> int:
-        """Return the number of items in the dataset."""
-        return super().__len__()
+    def __getstate__(self):
+        # Locks aren't picklable; rebuild one on the other side.
+        return {
+            slot: getattr(self, slot)
+            for cls in type(self).__mro__
+            for slot in getattr(cls, "__slots__", ())
+            if slot != "_cache_lock"
+        }
 
-    def __repr__(self):
-        """Return a string representation of the dataset."""
-        return super().__repr__()
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            object.__setattr__(self, slot, value)
+        self._cache_lock = threading.Lock()
 
-    def __str__(self):
-        """Return a string representation of the dataset."""
-        return super().__str__()
+    def prefetch(self, buffer_size: int = 4):
+        """Iterate the split with parsing overlapped in a background thread.
+
+        A daemon thread parses ahead into a bounded queue while the caller
+        consumes, so JSON decoding overlaps downstream work (e.g. GPU
+        steps). Opt-in rather than the default __iter__ behavior, since it
+        spins up a thread per iteration and buffers parsed records.
+
+        Args:
+            buffer_size: Maximum number of parsed records buffered ahead.
+        """
+        out: "queue.Queue[Any]" = queue.Queue(maxsize=buffer_size)
+        stop = threading.Event()
+        done = _MISSING
+
+        def offer(item: Any) -> bool:
+            # A plain put() would block forever on a full queue once the
+            # consumer is gone; poll the stop flag instead.
+            while not stop.is_set():
+                try:
+                    out.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def producer() -> None:
+            try:
+                for value in self:
+                    if not offer(value):
+                        return
+                offer(done)
+            except BaseException as e:  # re-raised on the consuming thread
+                offer(e)
+
+        threading.Thread(target=producer, daemon=True).start()
+        try:
+            while True:
+                value = out.get()
+                if value is done:
+                    return
+                if isinstance(value, BaseException):
+                    # Parsed JSON can never be an exception instance, so this
+                    # can only be the producer's failure.
+                    raise value
+                yield value
+        finally:
+            # Runs on GeneratorExit too, so a consumer breaking mid-epoch
+            # releases the producer thread instead of leaking it.
+            stop.set()
+
+    def warm_all(self) -> None:
+        """Parse every record now and keep all of them cached.
+
+        When pysimdjson exposes its batched ndjson parser, the records are
+        joined and parsed in one pass, amortizing the per-record parser
+        setup over a single structural-index sweep. Expands the cache bound
+        to cover the whole split, so this trades memory for zero parse work
+        on later accesses.
+        """
+        data = self.data
+        with self._cache_lock:
+            if self._cache_max < len(data):
+                self._cache_max = len(data)
+            cache = self.cached_data
+            parse_many = getattr(_simdjson_parser, "parse_many", None) if _simdjson else None
+            if parse_many is not None:
+                buf = b"\n".join(x.encode("utf-8") if isinstance(x, str) else x for x in data)
+                # Same shared-parser rule as _parse_record: hold the module
+                # lock for the whole sweep so no other thread's parse()
+                # invalidates the documents mid-iteration.
+                with _simdjson_lock:
+                    for i, doc in enumerate(parse_many(buf)):
+                        if i not in cache:
+                            cache[i] = _materialize(doc)
+            else:
+                for i, x in enumerate(data):
+                    if i not in cache:
+                        cache[i] = _parse_record(x)
+
+    def parsed(self, workers: Optional[int] = None) -> Dataset:
+        """Parse every record up front, in parallel, into a plain Dataset.
+
+        Worth it when the full split will be iterated repeatedly (e.g. over
+        training epochs): parsing is spread across processes once instead of
+        happening lazily on the consuming thread, at the cost of holding the
+        whole parsed split in memory.
+
+        Args:
+            workers: Number of worker processes; defaults to the CPU count.
+        """
+        with ProcessPoolExecutor(workers) as pool:
+            data = list(pool.map(_parse_record, self.data, chunksize=64))
+        return Dataset(data=data, dataset=self.dataset, split=self.split)
 
     def __iter__(self):
         """Return an iterator over the dataset."""
+        # Sequential iteration never revisits an index, so don't populate the
+        # cache — doing so would evict genuinely hot random-access entries
+        # while keeping memory at the cap for no benefit. Locals avoid the
+        # per-item attribute/global lookups, which add up over 10^5 records.
+        cache_get = self.cached_data.get
+        parse = _parse_record
+        missing = _MISSING
         for i, x in enumerate(self.data):
-            if i not in self.cached_data:
-                self.cached_data[i] = json.loads(x)
-            yield self.cached_data[i]
+            value = cache_get(i, missing)
+            yield parse(x) if value is missing else value
 
     def select(self, indices: Sequence[int]) -> "Dataset":
         """Return a new dataset containing only the given indices."""
@@ -104,32 +424,53 @@ class LazyJsonDataset(Dataset):
         )  # type: ignore
 
 
-class DatasetDict:
+class DatasetDict(Mapping):
+    """A mapping from split name ("train"/"val"/"test") to its Dataset.
+
+    Being a real Mapping gives consumers .items()/.keys()/.values() and
+    `split in dsdict` for free; only the splits that are not None are
+    exposed.
+    """
+
+    __slots__ = ("train", "val", "test", "_splits")
+
+    _VALID_SPLITS = frozenset(("train", "val", "test"))
+
     def __init__(
         self,
         train: Optional[Dataset] = None,
         val: Optional[Dataset] = None,
         test: Optional[Dataset] = None,
     ) -> None:
+        # Populated by __setattr__ as the split attributes are assigned, so
+        # dsdict["train"] is a single dict lookup.
+        object.__setattr__(self, "_splits", {})
         self.train = train
         self.val = val
         self.test = test
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Keep the dispatch dict in sync with the split attributes.
+        object.__setattr__(self, name, value)
+        if name in self._VALID_SPLITS:
+            # During unpickling the split slots are restored before _splits,
+            # which then arrives fully populated — skip the sync until then.
+            splits = getattr(self, "_splits", None)
+            if splits is None:
+                return
+            if value is None:
+                splits.pop(name, None)
+            else:
+                splits[name] = value
+
     def __getitem__(self, key: str) -> Any:
-        if key == "train":
-            if self.train is None:
-                raise KeyError(key)
-            return self.train
-        elif key == "val":
-            if self.val is None:
-                raise KeyError(key)
-            return self.val
-        elif key == "test":
-            if self.test is None:
-                raise KeyError(key)
-            return self.test
-        else:
-            raise KeyError(key)
+        return self._splits[key]
+
+    def __iter__(self):
+        return iter(self._splits)
+
+    def __len__(self) -> int:
+        return len(self._splits)
 
     def __repr__(self):
         """Return a string representation of the dataset."""
@@ -0,0 +1,174 @@
+import gzip
+import json
+import pickle
+import threading
+import time
+
+import pytest
+
+from prior.utils.types import Dataset, DatasetDict, LazyJsonDataset, _zstandard
+
+
+def make_records(n):
+    return [json.dumps({"i": i}).encode("utf-8") for i in range(n)]
+
+
+def write_jsonl(path, records, trailing_newline=True):
+    data = b"\n".join(records)
+    if trailing_newline:
+        data += b"\n"
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+def test_from_jsonl_mmap(tmp_path):
+    path = write_jsonl(tmp_path / "d.jsonl", make_records(10))
+    ds = LazyJsonDataset.from_jsonl(path, "d", "train")
+    assert len(ds) == 10
+    assert ds[0] == {"i": 0}
+    assert ds[-1] == {"i": 9}
+    assert [x["i"] for x in ds] == list(range(10))
+
+
+def test_from_jsonl_no_trailing_newline(tmp_path):
+    path = write_jsonl(tmp_path / "d.jsonl", make_records(3), trailing_newline=False)
+    ds = LazyJsonDataset.from_jsonl(path, "d", "train")
+    assert len(ds) == 3
+    assert ds[2] == {"i": 2}
+
+
+def test_from_jsonl_empty_file(tmp_path):
+    path = str(tmp_path / "d.jsonl")
+    open(path, "wb").close()
+    ds = LazyJsonDataset.from_jsonl(path, "d", "train")
+    assert len(ds) == 0
+    assert list(ds) == []
+    ds2 = pickle.loads(pickle.dumps(ds))
+    assert len(ds2) == 0
+
+
+def test_from_jsonl_gzip(tmp_path):
+    path = str(tmp_path / "d.jsonl.gz")
+    with gzip.open(path, "wb") as f:
+        f.write(b"\n".join(make_records(5)) + b"\n")
+    ds = LazyJsonDataset.from_jsonl(path, "d", "train")
+    assert len(ds) == 5
+    assert ds[3] == {"i": 3}
+
+
+@pytest.mark.skipif(_zstandard is None, reason="zstandard is not installed.")
+def test_from_jsonl_zstd(tmp_path):
+    path = str(tmp_path / "d.jsonl.zst")
+    with open(path, "wb") as f:
+        f.write(_zstandard.ZstdCompressor().compress(b"\n".join(make_records(5)) + b"\n"))
+    ds = LazyJsonDataset.from_jsonl(path, "d", "train")
+    assert len(ds) == 5
+    assert ds[4] == {"i": 4}
+
+
+def test_mmap_dataset_pickle_round_trip(tmp_path):
+    path = write_jsonl(tmp_path / "d.jsonl", make_records(10))
+    ds = LazyJsonDataset.from_jsonl(path, "d", "train")
+    ds[2]
+    ds2 = pickle.loads(pickle.dumps(ds))
+    assert len(ds2) == 10
+    assert ds2[7] == {"i": 7}
+    assert [x["i"] for x in ds2] == list(range(10))
+
+
+def test_lazy_dataset_pickle_round_trip():
+    ds = LazyJsonDataset(make_records(4), "d", "train")
+    ds2 = pickle.loads(pickle.dumps(ds))
+    assert len(ds2) == 4
+    assert ds2[1] == {"i": 1}
+
+
+def test_lru_eviction():
+    ds = LazyJsonDataset(make_records(10), "d", "train", cache_size=3)
+    for i in range(10):
+        assert ds[i] == {"i": i}
+    assert list(ds.cached_data) == [7, 8, 9]
+    ds[8]
+    ds[0]
+    assert list(ds.cached_data) == [9, 8, 0]
+
+
+def test_iter_does_not_populate_cache():
+    ds = LazyJsonDataset(make_records(10), "d", "train", cache_size=3)
+    assert [x["i"] for x in ds] == list(range(10))
+    assert len(ds.cached_data) == 0
+
+
+def test_str_records_encoded_once():
+    ds = LazyJsonDataset(['{"i": 0}', b'{"i": 1}'], "d", "train")
+    assert all(isinstance(x, bytes) for x in ds.data)
+    assert ds[0] == {"i": 0}
+    assert ds[1] == {"i": 1}
+
+
+def test_warm_all():
+    ds = LazyJsonDataset(make_records(20), "d", "train", cache_size=3)
+    ds.warm_all()
+    assert len(ds.cached_data) == 20
+    assert ds[19] == {"i": 19}
+
+
+def test_parsed():
+    ds = LazyJsonDataset(make_records(50), "d", "train")
+    eager = ds.parsed(workers=2)
+    assert isinstance(eager, Dataset)
+    assert len(eager) == 50
+    assert eager[42] == {"i": 42}
+
+
+def test_prefetch():
+    ds = LazyJsonDataset(make_records(100), "d", "train")
+    assert [x["i"] for x in ds.prefetch()] == list(range(100))
+
+
+def test_prefetch_early_exit_releases_thread():
+    ds = LazyJsonDataset(make_records(1000), "d", "train")
+    base = threading.active_count()
+    for _ in range(5):
+        for _item in ds.prefetch(buffer_size=2):
+            break
+    time.sleep(1.0)
+    assert threading.active_count() == base
+
+
+def test_dataset_dict_mapping():
+    train = Dataset([1], "d", "train")
+    test = Dataset([2], "d", "test")
+    dd = DatasetDict(train=train, test=test)
+    assert dd["train"] is train
+    assert list(dd) == ["train", "test"]
+    assert len(dd) == 2
+    assert "train" in dd and "val" not in dd
+    assert dict(dd.items())["test"] is test
+    assert dd.get("val") is None
+    with pytest.raises(KeyError):
+        dd["val"]
+
+
+def test_dataset_dict_attribute_sync():
+    dd = DatasetDict(train=Dataset([1], "d", "train"))
+    dd.val = Dataset([2], "d", "val")
+    assert dd["val"][0] == 2
+    dd.train = None
+    with pytest.raises(KeyError):
+        dd["train"]
+
+
+def test_dataset_dict_pickle_round_trip():
+    dd = DatasetDict(train=Dataset([1], "d", "train"))
+    dd2 = pickle.loads(pickle.dumps(dd))
+    assert list(dd2) == ["train"]
+    assert dd2["train"][0] == 1
+
+
+def test_streaming_repr_is_lazy():
+    ds = Dataset((i for i in range(5)), "d", "train")
+    assert "size=unknown" in repr(ds)
+    sized = Dataset((i for i in range(5)), "d", "train", length=5)
+    assert "size=5" in repr(sized)